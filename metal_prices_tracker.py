@@ -1,25 +1,58 @@
 import argparse
-import csv
+import asyncio
+import atexit
+import functools
+import io
+import json
 import os
+import sys
+import tempfile
+import time
 from abc import ABC
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Sized
+import httpx
+import orjson
 
+if TYPE_CHECKING:
+    # numpy/numba are only needed for batch backfills; imported lazily there so
+    # live and cron runs don't pay for them at startup
+    import numpy as np
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Holds configuration constants (injected for testability)."""
 
-    CSV_FILE = "prices_log.csv"
-    LOG_FILE = "prices.log"
-    GOLD_API_URL = "https://api.gold-api.com/price/XAU"
-    SILVER_API_URL = "https://api.gold-api.com/price/XAG"
-    EXCHANGE_API_URL = "https://open.er-api.com/v6/latest/USD"
-    OUNCE_TO_GRAM = 31.1034768  # Troy ounce to grams conversion
-    PRECISION_OUNCE = 2  # Decimal places for ounce prices
-    PRECISION_GRAM = 4  # Decimal places for gram prices
+    CSV_FILE: str = "prices_log.csv"
+    LOG_FILE: str = "prices.log"
+    GOLD_API_URL: str = "https://api.gold-api.com/price/XAU"
+    SILVER_API_URL: str = "https://api.gold-api.com/price/XAG"
+    EXCHANGE_API_URL: str = "https://open.er-api.com/v6/latest/USD"
+    RATE_CACHE_FILE: str = ".egp_rate_cache.json"  # Stored next to CSV_FILE
+    RATE_TTL_SECONDS: int = 3600  # Upstream refreshes roughly once per day
+    OUNCE_TO_GRAM: float = 31.1034768  # Troy ounce to grams conversion
+    PRECISION_OUNCE: int = 2  # Decimal places for ounce prices
+    PRECISION_GRAM: int = 4  # Decimal places for gram prices
+
+
+# One CSV row, pre-formatted in a single pass. Fields are ISO timestamps and
+# floats, which never contain the delimiter, so no CSV quoting is needed. The
+# \r\n terminator matches the csv module default used by existing log files.
+_ROW_FMT = (
+    "{};{:.{po}f};{:.{po}f};{:.{po}f};{:.{po}f};"
+    "{:.{pg}f};{:.{pg}f};{:.{pg}f};{:.{pg}f}\r\n"
+)
+
+
+def _fmt_ts() -> str:
+    """Current UTC time as ISO 8601, without building a datetime object."""
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        + f".{ns // 1000:06d}+00:00"
+    )
 
 
 class ApiError(Exception):
@@ -28,109 +61,405 @@ class ApiError(Exception):
     pass
 
 
-class ApiFetcher(ABC):
-    """Abstract base for API fetchers (SRP: handles HTTP with retries)."""
+@dataclass(frozen=True, slots=True)
+class PriceSnapshot:
+    """One timestamped set of prices, fields in CSV column order."""
+
+    timestamp: str
+    gold_usd_oz: float
+    silver_usd_oz: float
+    gold_egp_oz: float
+    silver_egp_oz: float
+    gold_usd_g: float
+    silver_usd_g: float
+    gold_egp_g: float
+    silver_egp_g: float
+
+    def as_row(self) -> tuple:
+        """Fields in CSV column order (shallow; dataclasses.astuple deep-copies)."""
+        return (
+            self.timestamp,
+            self.gold_usd_oz,
+            self.silver_usd_oz,
+            self.gold_egp_oz,
+            self.silver_egp_oz,
+            self.gold_usd_g,
+            self.silver_usd_g,
+            self.gold_egp_g,
+            self.silver_egp_g,
+        )
+
+
+_RETRY_TOTAL = 3  # Retries after the first attempt
+_RETRY_BACKOFF = 1.0  # Seconds; waits 0, 2, 4 like urllib3's backoff_factor=1
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_AFTER_STATUSES = frozenset({429, 503})  # Statuses whose Retry-After we honour
+_STATUS_OK = frozenset(range(200, 300))
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """Seconds to wait before retry number attempt (0-based), as urllib3's Retry.
+
+    response is None when the attempt failed at the transport level.
+    """
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after and response.status_code in _RETRY_AFTER_STATUSES:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:  # HTTP-date form
+            return max(
+                0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()
+            )
+        except (TypeError, ValueError):
+            pass  # Unparseable; fall back to exponential backoff
+    return 0.0 if attempt == 0 else _RETRY_BACKOFF * 2**attempt
+
+
+_KEEPALIVE_EXPIRY = 5.0  # httpx default idle time before a pooled connection closes
+_KEEPALIVE_SLACK = 5.0  # Extra idle seconds on top of --interval
+
+
+def build_session(
+    config: Config, keepalive_expiry: float = _KEEPALIVE_EXPIRY
+) -> httpx.AsyncClient:
+    """Build the one HTTP/2 client shared by all fetchers (DRY: pooled keep-alive).
+
+    Both gold-api.com requests multiplex over a single HTTP/2 connection.
+    Idle connections are dropped after keepalive_expiry seconds, so a daemon
+    must pass at least its interval for them to survive between runs.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        # No transport-level retries: _get retries connect and read failures
+        # itself, within the same _RETRY_TOTAL budget as status retries
+        limits=httpx.Limits(
+            max_connections=4,
+            max_keepalive_connections=4,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    # Bound connect/read so a stalled connection cannot poison the pool
+    timeout = httpx.Timeout(10.0, connect=3.05)
+    # requests followed redirects by default; keep that behaviour
+    return httpx.AsyncClient(
+        transport=transport, timeout=timeout, follow_redirects=True
+    )
+
+
+class AsyncApiFetcher(ABC):
+    """Abstract base for async API fetchers (SRP: handles HTTP with retries)."""
+
+    __slots__ = ("base_url", "config", "session")
 
-    def __init__(self, base_url: str, config: Config):
+    def __init__(self, base_url: str, config: Config, session: httpx.AsyncClient):
         self.base_url = base_url
         self.config = config
-        self.session = self._setup_session()
-
-    def _setup_session(self) -> requests.Session:
-        """Shared session setup with retries (DRY)."""
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+        self.session = session
+
+    async def _get(self, url: str) -> httpx.Response:
+        """Internal: GET, retrying transport errors and throttled/failed statuses.
+
+        Like urllib3's Retry(total=3): up to three retries in all, after which
+        the last error is raised or the last response returned.
+        """
+        for attempt in range(_RETRY_TOTAL):
+            try:
+                response = await self.session.get(url)
+            except httpx.TransportError:
+                response = None  # Connect/read failure or timeout; retry
+            else:
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+        return await self.session.get(url)
 
 
-class MetalPriceFetcher(ApiFetcher):
+class MetalPriceFetcher(AsyncApiFetcher):
     """Fetches metal prices (O: extensible for more metals)."""
 
-    def __init__(self, config: Config):
-        super().__init__("", config)  # No single base URL; use instance URLs
+    __slots__ = ()
+
+    def __init__(self, config: Config, session: httpx.AsyncClient):
+        # No single base URL; use instance URLs
+        super().__init__("", config, session)
 
-    def fetch_gold(self) -> float:
+    async def fetch_gold(self) -> float:
         """Fetch gold price in USD per troy ounce."""
-        return self._fetch_price(self.config.GOLD_API_URL)
+        return await self._fetch_price(self.config.GOLD_API_URL)
 
-    def fetch_silver(self) -> float:
+    async def fetch_silver(self) -> float:
         """Fetch silver price in USD per troy ounce."""
-        return self._fetch_price(self.config.SILVER_API_URL)
+        return await self._fetch_price(self.config.SILVER_API_URL)
 
-    def _fetch_price(self, url: str) -> float:
+    async def _fetch_price(self, url: str) -> float:
         """Internal: Fetch and parse price (DRY across metals)."""
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._get(url)
+            if response.status_code not in _STATUS_OK:
+                raise ApiError(f"HTTP {response.status_code} for {url}")
+            data = orjson.loads(response.content)
             if "price" in data:
                 return float(data["price"])
             raise ApiError(f"Unexpected format: {data}")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise ApiError(f"HTTP error for {url}: {e}")
 
 
-class ExchangeRateFetcher(ApiFetcher):
+class ExchangeRateFetcher(AsyncApiFetcher):
     """Fetches exchange rates (SRP: currency-specific)."""
 
-    def __init__(self, config: Config):
-        super().__init__(config.EXCHANGE_API_URL, config)
+    __slots__ = ()
 
-    def fetch_usd_to_egp(self) -> float:
+    def __init__(self, config: Config, session: httpx.AsyncClient):
+        super().__init__(config.EXCHANGE_API_URL, config, session)
+
+    async def fetch_usd_to_egp(self) -> float:
         """Fetch USD to EGP rate."""
         try:
-            response = self.session.get(self.base_url)
-            response.raise_for_status()
-            data = response.json()
+            response = await self._get(self.base_url)
+            if response.status_code not in _STATUS_OK:
+                raise ApiError(f"HTTP {response.status_code} for {self.base_url}")
+            data = orjson.loads(response.content)
             if data.get("result") == "success" and "rates" in data:
                 return data["rates"]["EGP"]
             raise ApiError(f"Unexpected format: {data}")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise ApiError(f"HTTP error: {e}")
 
 
+class CachedExchangeRateFetcher(ExchangeRateFetcher):
+    """Caches the USD to EGP rate on disk for a TTL (O: extends without modifying)."""
+
+    __slots__ = ("cache_file",)
+
+    def __init__(self, config: Config, session: httpx.AsyncClient):
+        super().__init__(config, session)
+        self.cache_file = os.path.join(
+            os.path.dirname(config.CSV_FILE), config.RATE_CACHE_FILE
+        )
+
+    async def fetch_usd_to_egp(self) -> float:
+        """Return the cached rate if still fresh, else fetch and cache it."""
+        cached = self._read_cache()
+        if cached is not None:
+            return cached
+        rate = await super().fetch_usd_to_egp()
+        self._write_cache(rate)
+        return rate
+
+    def _read_cache(self) -> Optional[float]:
+        """Internal: Load a fresh rate from disk; None on miss, expiry or corruption."""
+        try:
+            with open(self.cache_file, encoding="utf-8") as file:
+                data = json.load(file)
+            if time.time() - data["fetched_at"] < self.config.RATE_TTL_SECONDS:
+                return float(data["rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_cache(self, rate: float) -> None:
+        """Internal: Persist the rate atomically; failures just leave a cache miss."""
+        tmp_file = None
+        try:
+            # Unique temp name, so concurrent writers (cron + daemon) can't collide
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=os.path.dirname(self.cache_file) or os.curdir,
+                prefix=f"{os.path.basename(self.cache_file)}.",
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                tmp_file = file.name
+                json.dump({"rate": rate, "fetched_at": time.time()}, file)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            if tmp_file is not None:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
+
+def _check_lengths(*columns: Sized) -> None:
+    """Raise ValueError unless all batch columns have the same length."""
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"Batch columns differ in length: {sorted(lengths)}")
+
+
+@functools.cache
+def _compute_batch_kernel():
+    """Compile (once, on first backfill) the batch form of PriceConverter.convert."""
+    import numba
+    import numpy as np
+
+    def compute_vec(usd_oz_gold, usd_oz_silver, rates, recip):
+        # One fused loop; it does no bounds checking, so callers must pass
+        # arrays of equal length (see _check_lengths)
+        n = usd_oz_gold.shape[0]
+        gold_egp_oz = np.empty(n)
+        silver_egp_oz = np.empty(n)
+        gold_usd_g = np.empty(n)
+        silver_usd_g = np.empty(n)
+        gold_egp_g = np.empty(n)
+        silver_egp_g = np.empty(n)
+        for i in numba.prange(n):
+            rate = rates[i]
+            gold_egp_oz[i] = usd_oz_gold[i] * rate
+            silver_egp_oz[i] = usd_oz_silver[i] * rate
+            gold_usd_g[i] = usd_oz_gold[i] * recip
+            silver_usd_g[i] = usd_oz_silver[i] * recip
+            gold_egp_g[i] = gold_usd_g[i] * rate
+            silver_egp_g[i] = silver_usd_g[i] * rate
+        return (
+            gold_egp_oz,
+            silver_egp_oz,
+            gold_usd_g,
+            silver_usd_g,
+            gold_egp_g,
+            silver_egp_g,
+        )
+
+    return numba.njit(cache=True, parallel=True, fastmath=True)(compute_vec)
+
+
 class PriceConverter:
     """Converts prices (SRP: pure transformation, no I/O)."""
 
+    __slots__ = ("config", "_recip")
+
     def __init__(self, config: Config):
         self.config = config
+        # Divide once here so to_gram is a single multiply
+        self._recip = 1.0 / config.OUNCE_TO_GRAM
 
     def to_gram(self, usd_per_ounce: float) -> float:
         """Convert USD per ounce to per gram."""
-        return usd_per_ounce / self.config.OUNCE_TO_GRAM
+        return usd_per_ounce * self._recip
 
     def to_egp(self, usd_price: float, rate: float) -> float:
         """Convert USD price to EGP using rate."""
         return usd_price * rate
 
+    def convert(self, usd_oz_gold: float, usd_oz_silver: float, rate: float):
+        """Derive the six EGP and per-gram prices for one snapshot."""
+        gold_usd_g = self.to_gram(usd_oz_gold)
+        silver_usd_g = self.to_gram(usd_oz_silver)
+        return (
+            self.to_egp(usd_oz_gold, rate),
+            self.to_egp(usd_oz_silver, rate),
+            gold_usd_g,
+            silver_usd_g,
+            self.to_egp(gold_usd_g, rate),
+            self.to_egp(silver_usd_g, rate),
+        )
+
+    def convert_batch(
+        self,
+        usd_oz_gold: "np.ndarray",
+        usd_oz_silver: "np.ndarray",
+        rates: "np.ndarray",
+    ):
+        """Derive the six EGP and per-gram price arrays for N snapshots (JIT)."""
+        _check_lengths(usd_oz_gold, usd_oz_silver, rates)
+        kernel = _compute_batch_kernel()
+        return kernel(usd_oz_gold, usd_oz_silver, rates, self._recip)
+
 
 class DataLogger:
-    """Handles data persistence (SRP: CSV and log writing)."""
+    """Handles data persistence (SRP: CSV and log writing).
+
+    CSV rows are queued in memory and written LOG_BATCH_SIZE at a time, and
+    both files use block buffering, so rows reach disk when a batch or buffer
+    fills, on flush_now(), or at exit. Losing a sub-second of rows on a crash
+    is an accepted trade-off for one write(2) per batch instead of per row.
+    """
+
+    __slots__ = ("config", "_header_written", "_pending", "_csv_fh", "_log_fh")
+
+    LOG_BATCH_SIZE = 64  # CSV rows queued before each writelines call
+    CSV_BUFFER_SIZE = 65536  # Bytes buffered before each CSV write(2)
+    CSV_HEADER = [
+        "timestamp (UTC)",
+        "gold_usd_per_ounce",
+        "silver_usd_per_ounce",
+        "gold_egp_per_ounce",
+        "silver_egp_per_ounce",
+        "gold_usd_per_gram",
+        "silver_usd_per_gram",
+        "gold_egp_per_gram",
+        "silver_egp_per_gram",
+    ]
 
     def __init__(self, config: Config):
         self.config = config
+        # Stat once here; afterwards the header state is tracked in memory
+        self._header_written = (
+            os.path.isfile(config.CSV_FILE) and os.path.getsize(config.CSV_FILE) > 0
+        )
+        self._pending: List[bytes] = []  # Encoded CSV rows not yet written
+        # Open both files once and reuse the handles for every row
+        # CSV rows are pure ASCII, so write pre-encoded bytes and skip the
+        # TextIOWrapper codec layer entirely
+        self._csv_fh = open(config.CSV_FILE, "ab", buffering=self.CSV_BUFFER_SIZE)
+        self._log_fh = open(
+            config.LOG_FILE, "a", encoding="utf-8", buffering=io.DEFAULT_BUFFER_SIZE
+        )
+        atexit.register(self.close)
+
+    def flush_now(self) -> None:
+        """Push queued and buffered rows to disk now (e.g. for single-shot runs)."""
+        self._write_pending()
+        self._csv_fh.flush()
+        self._log_fh.flush()
+
+    def close(self) -> None:
+        """Flush and close the CSV and log files (safe to call twice)."""
+        if not self._csv_fh.closed:
+            self._write_pending()
+        self._csv_fh.close()
+        self._log_fh.close()
+
+    def log(self, snap: PriceSnapshot, quiet: bool = False) -> None:
+        """Append to CSV and log file (DRY: unified entry point)."""
+        self._append_to_csv(snap)
+        self._append_to_log(snap, quiet)
+
+    def _append_to_csv(self, snap: PriceSnapshot) -> None:
+        """Queue row for CSV (semicolon-delimited)."""
+        self._pending.append(
+            _ROW_FMT.format(
+                *snap.as_row(),
+                po=self.config.PRECISION_OUNCE,
+                pg=self.config.PRECISION_GRAM,
+            ).encode("ascii")
+        )
+        if len(self._pending) >= self.LOG_BATCH_SIZE:
+            self._write_pending()
 
-    def log(
+    def log_many(self, snaps: Iterable[PriceSnapshot]) -> None:
+        """Queue many CSV rows at once."""
+        self._queue_rows(snap.as_row() for snap in snaps)
+
+    def log_batch(
         self,
-        timestamp: str,
-        gold_usd_oz: float,
-        silver_usd_oz: float,
-        gold_egp_oz: float,
-        silver_egp_oz: float,
-        gold_usd_g: float,
-        silver_usd_g: float,
-        gold_egp_g: float,
-        silver_egp_g: float,
-        quiet: bool = False,
+        timestamps: Sequence[str],
+        gold_usd_oz: "np.ndarray",
+        silver_usd_oz: "np.ndarray",
+        gold_egp_oz: "np.ndarray",
+        silver_egp_oz: "np.ndarray",
+        gold_usd_g: "np.ndarray",
+        silver_usd_g: "np.ndarray",
+        gold_egp_g: "np.ndarray",
+        silver_egp_g: "np.ndarray",
     ) -> None:
-        """Append to CSV and log file (DRY: unified entry point)."""
-        self._append_to_csv(
-            timestamp,
+        """Queue N rows for CSV from parallel price arrays (for backfills)."""
+        _check_lengths(
+            timestamps,
             gold_usd_oz,
             silver_usd_oz,
             gold_egp_oz,
@@ -140,107 +469,80 @@ class DataLogger:
             gold_egp_g,
             silver_egp_g,
         )
-        self._append_to_log(
-            timestamp,
-            gold_usd_oz,
-            silver_usd_oz,
-            gold_egp_oz,
-            silver_egp_oz,
-            gold_usd_g,
-            silver_usd_g,
-            gold_egp_g,
-            silver_egp_g,
-            quiet,
+        # Format straight from the columns; no PriceSnapshot per row
+        rows = zip(
+            timestamps,
+            gold_usd_oz.tolist(),
+            silver_usd_oz.tolist(),
+            gold_egp_oz.tolist(),
+            silver_egp_oz.tolist(),
+            gold_usd_g.tolist(),
+            silver_usd_g.tolist(),
+            gold_egp_g.tolist(),
+            silver_egp_g.tolist(),
         )
-
-    def _append_to_csv(
-        self,
-        timestamp: str,
-        gold_usd_oz: float,
-        silver_usd_oz: float,
-        gold_egp_oz: float,
-        silver_egp_oz: float,
-        gold_usd_g: float,
-        silver_usd_g: float,
-        gold_egp_g: float,
-        silver_egp_g: float,
-    ) -> None:
-        """Append row to CSV (semicolon-delimited)."""
-        file_exists = os.path.isfile(self.config.CSV_FILE)
-        with open(self.config.CSV_FILE, "a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file, delimiter=";")
-            if not file_exists:
-                writer.writerow(
-                    [
-                        "timestamp (UTC)",
-                        "gold_usd_per_ounce",
-                        "silver_usd_per_ounce",
-                        "gold_egp_per_ounce",
-                        "silver_egp_per_ounce",
-                        "gold_usd_per_gram",
-                        "silver_usd_per_gram",
-                        "gold_egp_per_gram",
-                        "silver_egp_per_gram",
-                    ]
-                )
-            writer.writerow(
-                [
-                    timestamp,
-                    f"{gold_usd_oz:.{self.config.PRECISION_OUNCE}f}",
-                    f"{silver_usd_oz:.{self.config.PRECISION_OUNCE}f}",
-                    f"{gold_egp_oz:.{self.config.PRECISION_OUNCE}f}",
-                    f"{silver_egp_oz:.{self.config.PRECISION_OUNCE}f}",
-                    f"{gold_usd_g:.{self.config.PRECISION_GRAM}f}",
-                    f"{silver_usd_g:.{self.config.PRECISION_GRAM}f}",
-                    f"{gold_egp_g:.{self.config.PRECISION_GRAM}f}",
-                    f"{silver_egp_g:.{self.config.PRECISION_GRAM}f}",
-                ]
-            )
-
-    def _append_to_log(
-        self,
-        timestamp: str,
-        gold_usd_oz: float,
-        silver_usd_oz: float,
-        gold_egp_oz: float,
-        silver_egp_oz: float,
-        gold_usd_g: float,
-        silver_usd_g: float,
-        gold_egp_g: float,
-        silver_egp_g: float,
-        quiet: bool,
-    ) -> None:
+        self._queue_rows(rows)
+
+    def _queue_rows(self, rows: Iterable[tuple]) -> None:
+        """Internal: Encode and queue field tuples in CSV column order."""
+        po = self.config.PRECISION_OUNCE
+        pg = self.config.PRECISION_GRAM
+        # Encode the whole batch before queueing it, so a row that fails to
+        # encode leaves no earlier rows from the same batch behind
+        encoded = [_ROW_FMT.format(*row, po=po, pg=pg).encode("ascii") for row in rows]
+        self._pending.extend(encoded)
+        if len(self._pending) >= self.LOG_BATCH_SIZE:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Internal: Write queued rows in one writelines call, header first if new."""
+        if not self._pending:
+            return
+        if not self._header_written:
+            self._csv_fh.write((";".join(self.CSV_HEADER) + "\r\n").encode("ascii"))
+            self._header_written = True
+        self._csv_fh.writelines(self._pending)
+        self._pending.clear()
+
+    def _append_error(self, error_msg: str) -> None:
+        """Append an error line to the log file (shares the open handle)."""
+        self._log_fh.write(error_msg)
+
+    def _append_to_log(self, snap: PriceSnapshot, quiet: bool) -> None:
         """Append summary to log file; print table if not quiet."""
         log_entry = (
-            f"[{timestamp}] Gold (oz/g): ${gold_usd_oz:.{self.config.PRECISION_OUNCE}f}/${gold_usd_g:.{self.config.PRECISION_GRAM}f} USD, "
-            f"E£{gold_egp_oz:.{self.config.PRECISION_OUNCE}f}/{gold_egp_g:.{self.config.PRECISION_GRAM}f} EGP | "
-            f"Silver (oz/g): ${silver_usd_oz:.{self.config.PRECISION_OUNCE}f}/${silver_usd_g:.{self.config.PRECISION_GRAM}f} USD, "
-            f"E£{silver_egp_oz:.{self.config.PRECISION_OUNCE}f}/{silver_egp_g:.{self.config.PRECISION_GRAM}f} EGP\n"
+            f"[{snap.timestamp}] Gold (oz/g): ${snap.gold_usd_oz:.{self.config.PRECISION_OUNCE}f}/${snap.gold_usd_g:.{self.config.PRECISION_GRAM}f} USD, "
+            f"E£{snap.gold_egp_oz:.{self.config.PRECISION_OUNCE}f}/{snap.gold_egp_g:.{self.config.PRECISION_GRAM}f} EGP | "
+            f"Silver (oz/g): ${snap.silver_usd_oz:.{self.config.PRECISION_OUNCE}f}/${snap.silver_usd_g:.{self.config.PRECISION_GRAM}f} USD, "
+            f"E£{snap.silver_egp_oz:.{self.config.PRECISION_OUNCE}f}/{snap.silver_egp_g:.{self.config.PRECISION_GRAM}f} EGP\n"
         )
-        with open(self.config.LOG_FILE, "a", encoding="utf-8") as log:
-            log.write(log_entry)
+        self._log_fh.write(log_entry)
 
         if not quiet:
-            print("\n=== Latest Prices ===")
-            print(f"Timestamp: {timestamp}")
-            print(
-                f"{'Metal':<10} {'USD (oz)':<12} {'EGP (oz)':<12} {'USD (g)':<12} {'EGP (g)':<12}"
-            )
-            print(
-                f"{'Gold':<10} ${gold_usd_oz:>10.{self.config.PRECISION_OUNCE}f}  E£{gold_egp_oz:>10.{self.config.PRECISION_OUNCE}f}  ${gold_usd_g:>10.{self.config.PRECISION_GRAM}f}  E£{gold_egp_g:>10.{self.config.PRECISION_GRAM}f}"
-            )
-            print(
-                f"{'Silver':<10} ${silver_usd_oz:>10.{self.config.PRECISION_OUNCE}f}  E£{silver_egp_oz:>10.{self.config.PRECISION_OUNCE}f}  ${silver_usd_g:>10.{self.config.PRECISION_GRAM}f}  E£{silver_egp_g:>10.{self.config.PRECISION_GRAM}f}"
-            )
-            print("====================\n")
-            print(
-                f"Data appended to {self.config.CSV_FILE}. Open in a spreadsheet for full table view."
+            # One write instead of seven print() calls: one stdout lock, no partial output
+            sys.stdout.write(
+                "\n=== Latest Prices ===\n"
+                f"Timestamp: {snap.timestamp}\n"
+                f"{'Metal':<10} {'USD (oz)':<12} {'EGP (oz)':<12} {'USD (g)':<12} {'EGP (g)':<12}\n"
+                f"{'Gold':<10} ${snap.gold_usd_oz:>10.{self.config.PRECISION_OUNCE}f}  E£{snap.gold_egp_oz:>10.{self.config.PRECISION_OUNCE}f}  ${snap.gold_usd_g:>10.{self.config.PRECISION_GRAM}f}  E£{snap.gold_egp_g:>10.{self.config.PRECISION_GRAM}f}\n"
+                f"{'Silver':<10} ${snap.silver_usd_oz:>10.{self.config.PRECISION_OUNCE}f}  E£{snap.silver_egp_oz:>10.{self.config.PRECISION_OUNCE}f}  ${snap.silver_usd_g:>10.{self.config.PRECISION_GRAM}f}  E£{snap.silver_egp_g:>10.{self.config.PRECISION_GRAM}f}\n"
+                "====================\n\n"
+                f"Data appended to {self.config.CSV_FILE}. Open in a spreadsheet for full table view.\n"
             )
 
 
 class PriceTracker:
     """Orchestrates price tracking (DIP: depends on abstractions)."""
 
+    __slots__ = (
+        "config",
+        "session",
+        "metal_fetcher",
+        "rate_fetcher",
+        "converter",
+        "logger",
+    )
+
     def __init__(
         self,
         config: Config,
@@ -248,8 +550,10 @@ class PriceTracker:
         rate_fetcher: ExchangeRateFetcher,
         converter: PriceConverter,
         logger: DataLogger,
+        session: httpx.AsyncClient,
     ):
         self.config = config
+        self.session = session
         self.metal_fetcher = metal_fetcher
         self.rate_fetcher = rate_fetcher
         self.converter = converter
@@ -269,93 +573,136 @@ class PriceTracker:
             else:
                 print("Please enter 'y' or 'n'.")
 
-    def run(self, quiet: bool = False) -> None:
+    async def run(self, quiet: bool = False) -> None:
         """Execute the full workflow: fetch, convert, log, and prompt to save."""
         try:
-            # Fetch
-            gold_usd_oz = self.metal_fetcher.fetch_gold()
-            silver_usd_oz = self.metal_fetcher.fetch_silver()
-            rate = self.rate_fetcher.fetch_usd_to_egp()
-
-            # Convert to EGP per ounce
-            gold_egp_oz = gold_usd_oz * rate
-            silver_egp_oz = silver_usd_oz * rate
-
-            # Convert to per gram
-            gold_usd_g = self.converter.to_gram(gold_usd_oz)
-            silver_usd_g = self.converter.to_gram(silver_usd_oz)
-            gold_egp_g = self.converter.to_egp(gold_usd_g, rate)
-            silver_egp_g = self.converter.to_egp(silver_usd_g, rate)
+            # Fetch (all three requests are independent, so overlap them)
+            gold_usd_oz, silver_usd_oz, rate = await asyncio.gather(
+                self.metal_fetcher.fetch_gold(),
+                self.metal_fetcher.fetch_silver(),
+                self.rate_fetcher.fetch_usd_to_egp(),
+            )
 
-            # Display/log to console and log file (but not CSV yet)
-            timestamp = datetime.now(timezone.utc).isoformat()
-            self.logger._append_to_log(
-                timestamp,
+            # Convert to EGP per ounce, then to per gram
+            snap = PriceSnapshot(
+                _fmt_ts(),
                 gold_usd_oz,
                 silver_usd_oz,
-                gold_egp_oz,
-                silver_egp_oz,
-                gold_usd_g,
-                silver_usd_g,
-                gold_egp_g,
-                silver_egp_g,
-                quiet,
+                *self.converter.convert(gold_usd_oz, silver_usd_oz, rate),
             )
 
+            # Display/log to console and log file (but not CSV yet)
+            self.logger._append_to_log(snap, quiet)
+
             # Prompt to save if not quiet (interactive mode)
             if not quiet:
                 if self.prompt_save():
-                    self.logger._append_to_csv(
-                        timestamp,
-                        gold_usd_oz,
-                        silver_usd_oz,
-                        gold_egp_oz,
-                        silver_egp_oz,
-                        gold_usd_g,
-                        silver_usd_g,
-                        gold_egp_g,
-                        silver_egp_g,
-                    )
+                    self.logger._append_to_csv(snap)
+                    self.logger.flush_now()
                     print("Prices saved to prices_log.csv and prices.log.")
                 else:
                     # Already greeted in prompt_save
                     return
             else:
                 # In quiet mode, always save both CSV and log
-                self.logger._append_to_csv(
-                    timestamp,
-                    gold_usd_oz,
-                    silver_usd_oz,
-                    gold_egp_oz,
-                    silver_egp_oz,
-                    gold_usd_g,
-                    silver_usd_g,
-                    gold_egp_g,
-                    silver_egp_g,
-                )
+                self.logger._append_to_csv(snap)
 
         except ApiError as e:
             self._handle_error(e, quiet)
         except Exception as e:
             self._handle_error(e, quiet)
 
+    def run_batch(
+        self,
+        timestamps: Sequence[str],
+        usd_oz_gold: "np.ndarray",
+        usd_oz_silver: "np.ndarray",
+        rates: "np.ndarray",
+    ) -> Dict[str, "np.ndarray"]:
+        """Convert and save N historical snapshots at once (JIT-compiled backfill)."""
+        import numpy as np
+
+        usd_oz_gold = np.asarray(usd_oz_gold, dtype=np.float64)
+        usd_oz_silver = np.asarray(usd_oz_silver, dtype=np.float64)
+        rates = np.asarray(rates, dtype=np.float64)
+        _check_lengths(timestamps, usd_oz_gold, usd_oz_silver, rates)
+        (
+            gold_egp_oz,
+            silver_egp_oz,
+            gold_usd_g,
+            silver_usd_g,
+            gold_egp_g,
+            silver_egp_g,
+        ) = self.converter.convert_batch(usd_oz_gold, usd_oz_silver, rates)
+        results = {
+            "gold_usd_oz": usd_oz_gold,
+            "silver_usd_oz": usd_oz_silver,
+            "gold_egp_oz": gold_egp_oz,
+            "silver_egp_oz": silver_egp_oz,
+            "gold_usd_g": gold_usd_g,
+            "silver_usd_g": silver_usd_g,
+            "gold_egp_g": gold_egp_g,
+            "silver_egp_g": silver_egp_g,
+        }
+        self.logger.log_batch(timestamps, **results)
+        return results
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session once no more runs are needed."""
+        await self.session.aclose()
+
     def _handle_error(self, error: Exception, quiet: bool) -> None:
         """Centralized error handling (clean: one place)."""
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = _fmt_ts()
         error_msg = f"[{timestamp}] Error: {error}\n"
         if not quiet:
             print(error_msg, end="")
-        with open(self.config.LOG_FILE, "a", encoding="utf-8") as log:
-            log.write(error_msg)
+        self.logger._append_error(error_msg)
 
 
-def create_tracker(config: Config) -> PriceTracker:
+def create_tracker(
+    config: Config, keepalive_expiry: float = _KEEPALIVE_EXPIRY
+) -> PriceTracker:
     """Factory: Creates tracker with dependencies (DIP: high-level module)."""
-    metal_fetcher = MetalPriceFetcher(config)
-    rate_fetcher = ExchangeRateFetcher(config)
+    session = build_session(config, keepalive_expiry)
+    metal_fetcher = MetalPriceFetcher(config, session)
+    rate_fetcher = CachedExchangeRateFetcher(config, session)
     converter = PriceConverter(config)
     logger = DataLogger(config)
-    return PriceTracker(config, metal_fetcher, rate_fetcher, converter, logger)
+    return PriceTracker(config, metal_fetcher, rate_fetcher, converter, logger, session)
+
+
+async def _run_live(config: Config, quiet: bool, interval: Optional[float]) -> None:
+    """Build the tracker inside the event loop; run once, or every interval seconds.
+
+    As a long-lived daemon the shared session keeps its pooled connections idle
+    for a little longer than the interval, so later runs skip the TLS handshakes
+    as long as the servers keep the connections open that long too.
+    """
+    keepalive_expiry = _KEEPALIVE_EXPIRY
+    if interval:
+        keepalive_expiry = max(keepalive_expiry, interval + _KEEPALIVE_SLACK)
+    tracker = create_tracker(config, keepalive_expiry)
+    try:
+        await tracker.run(quiet)
+        while interval:
+            # A daemon may run for days; don't let queued rows wait for exit
+            tracker.logger.flush_now()
+            await asyncio.sleep(interval)
+            await tracker.run(quiet)
+    finally:
+        await tracker.aclose()
+
+
+def _positive_float(value: str) -> float:
+    """argparse type: a float strictly greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not 0 < number < float("inf"):  # Also rejects nan
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
 
 
 def main():
@@ -367,27 +714,30 @@ def main():
         "--quiet", action="store_true", help="Suppress console output (for cron)."
     )
     parser.add_argument("--test", action="store_true", help="Run test mode.")
+    parser.add_argument(
+        "--interval",
+        type=_positive_float,
+        metavar="SECONDS",
+        help="Keep running and fetch every SECONDS (daemon; requires --quiet).",
+    )
     args = parser.parse_args()
+    if args.interval is not None and not args.quiet:
+        # Interactive mode would block on the save prompt every cycle
+        parser.error("--interval requires --quiet")
+    if args.interval is not None and args.test:
+        # Test mode logs one mock snapshot and exits; nothing to repeat
+        parser.error("--interval cannot be used with --test")
 
     config = Config()
-    tracker = create_tracker(config)
 
     if args.test:
         # Test: Mock data (no APIs) - ounce first, then gram
-        timestamp = datetime.now(timezone.utc).isoformat()
-        # Always display and prompt to save in test mode unless --quiet
-        tracker.logger._append_to_log(
-            timestamp,
-            2000.00,
-            25.00,
-            96260.00,
-            1203.25,
-            64.28,
-            0.80,
-            3092.50,
-            38.50,
-            args.quiet,
+        snap = PriceSnapshot(
+            _fmt_ts(), 2000.00, 25.00, 96260.00, 1203.25, 64.28, 0.80, 3092.50, 38.50
         )
+        # Always display and prompt to save in test mode unless --quiet
+        logger = DataLogger(config)
+        logger._append_to_log(snap, args.quiet)
         if not args.quiet:
             # Prompt to save
             while True:
@@ -397,17 +747,8 @@ def main():
                     .lower()
                 )
                 if choice == "y":
-                    tracker.logger._append_to_csv(
-                        timestamp,
-                        2000.00,
-                        25.00,
-                        96260.00,
-                        1203.25,
-                        64.28,
-                        0.80,
-                        3092.50,
-                        38.50,
-                    )
+                    logger._append_to_csv(snap)
+                    logger.flush_now()
                     print("Prices saved to prices_log.csv and prices.log.")
                     break
                 elif choice == "n":
@@ -418,19 +759,12 @@ def main():
             print("Test log completed. Check prices_log.csv and prices.log")
         else:
             # In quiet mode, always save
-            tracker.logger._append_to_csv(
-                timestamp,
-                2000.00,
-                25.00,
-                96260.00,
-                1203.25,
-                64.28,
-                0.80,
-                3092.50,
-                38.50,
-            )
+            logger._append_to_csv(snap)
     else:
-        tracker.run(args.quiet)
+        try:
+            asyncio.run(_run_live(config, args.quiet, args.interval))
+        except KeyboardInterrupt:
+            pass  # Ctrl+C is the normal way to stop --interval mode
 
 
 if __name__ == "__main__":
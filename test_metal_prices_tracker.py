@@ -0,0 +1,276 @@
+import asyncio
+import json
+import os
+import time
+from email.utils import formatdate
+
+import httpx
+import numpy as np
+import pytest
+
+from metal_prices_tracker import (
+    ApiError,
+    CachedExchangeRateFetcher,
+    Config,
+    DataLogger,
+    MetalPriceFetcher,
+    PriceConverter,
+    PriceSnapshot,
+    PriceTracker,
+    main,
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        CSV_FILE=str(tmp_path / "prices_log.csv"),
+        LOG_FILE=str(tmp_path / "prices.log"),
+    )
+
+
+@pytest.fixture
+def tracker(config):
+    logger = DataLogger(config)
+    yield PriceTracker(config, None, None, PriceConverter(config), logger, None)
+    logger.close()
+
+
+def mock_session(handler):
+    """AsyncClient whose requests are answered by handler (records each request)."""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(record)), requests
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry back-off delays instead of actually sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def scripted(*steps):
+    """Handler replying with each step in turn: a status code, Response or error."""
+    steps = iter(steps)
+
+    def handler(request):
+        step = next(steps)
+        if isinstance(step, Exception):
+            raise step
+        if isinstance(step, int):
+            price = {"price": 2000.0} if step == 200 else {}
+            return httpx.Response(step, json=price)
+        return step
+
+    return handler
+
+
+def fetch_gold(config, handler):
+    session, requests = mock_session(handler)
+    fetcher = MetalPriceFetcher(config, session)
+    return asyncio.run(fetcher.fetch_gold()), requests
+
+
+def test_get_retries_failed_statuses_with_urllib3_backoff(config, sleeps):
+    price, requests = fetch_gold(config, scripted(503, 502, 200))
+    assert price == 2000.0
+    assert len(requests) == 3
+    assert sleeps == [0.0, 2.0]
+
+
+def test_get_honours_retry_after_seconds(config, sleeps):
+    price, _ = fetch_gold(
+        config, scripted(httpx.Response(429, headers={"Retry-After": "7"}), 200)
+    )
+    assert price == 2000.0
+    assert sleeps == [7.0]
+
+
+def test_get_honours_retry_after_http_date(config, sleeps):
+    retry_at = formatdate(time.time() + 30, usegmt=True)
+    fetch_gold(
+        config, scripted(httpx.Response(503, headers={"Retry-After": retry_at}), 200)
+    )
+    assert 25 < sleeps[0] <= 30
+
+
+def test_get_gives_up_after_last_retry(config, sleeps):
+    with pytest.raises(ApiError, match="HTTP 503"):
+        fetch_gold(config, scripted(503, 503, 503, 503, 200))
+    assert sleeps == [0.0, 2.0, 4.0]
+
+
+def test_get_retries_transport_errors(config, sleeps):
+    price, requests = fetch_gold(
+        config, scripted(httpx.ReadTimeout("slow"), httpx.ConnectError("reset"), 200)
+    )
+    assert price == 2000.0
+    assert len(requests) == 3
+
+
+def test_get_raises_after_last_transport_error(config, sleeps):
+    errors = [httpx.RemoteProtocolError("dropped") for _ in range(4)]
+    with pytest.raises(ApiError, match="dropped"):
+        fetch_gold(config, scripted(*errors, 200))
+    assert len(sleeps) == 3
+
+
+def rate_response(request):
+    return httpx.Response(200, json={"result": "success", "rates": {"EGP": 48.5}})
+
+
+def fetch_rate(config, handler=rate_response):
+    session, requests = mock_session(handler)
+    fetcher = CachedExchangeRateFetcher(config, session)
+    return asyncio.run(fetcher.fetch_usd_to_egp()), requests, fetcher.cache_file
+
+
+def write_cache(config, rate, fetched_at):
+    path = os.path.join(os.path.dirname(config.CSV_FILE), config.RATE_CACHE_FILE)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"rate": rate, "fetched_at": fetched_at}, file)
+
+
+def test_cached_rate_hit_skips_http(config):
+    write_cache(config, 50.0, time.time())
+    rate, requests, _ = fetch_rate(config)
+    assert rate == 50.0
+    assert requests == []
+
+
+def test_cached_rate_expired_refetches_and_rewrites(config):
+    write_cache(config, 50.0, time.time() - config.RATE_TTL_SECONDS - 1)
+    rate, requests, cache_file = fetch_rate(config)
+    assert rate == 48.5
+    assert len(requests) == 1
+    with open(cache_file, encoding="utf-8") as file:
+        assert json.load(file)["rate"] == 48.5
+
+
+def test_cached_rate_corrupt_file_is_a_miss(config):
+    path = os.path.join(os.path.dirname(config.CSV_FILE), config.RATE_CACHE_FILE)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("{not json")
+    rate, requests, _ = fetch_rate(config)
+    assert rate == 48.5
+    assert len(requests) == 1
+
+
+def test_cached_rate_write_failure_still_returns_rate(tmp_path):
+    config = Config(CSV_FILE=str(tmp_path / "missing-dir" / "prices_log.csv"))
+    rate, requests, cache_file = fetch_rate(config)
+    assert rate == 48.5
+    assert not os.path.exists(cache_file)
+
+
+def test_to_gram_follows_ounce_to_gram_override():
+    converter = PriceConverter(Config(OUNCE_TO_GRAM=28.3495))
+    assert converter.to_gram(28.3495) == pytest.approx(1.0)
+
+
+def test_convert_batch_matches_scalar_convert(config):
+    converter = PriceConverter(config)
+    batch = converter.convert_batch(
+        np.array([2000.0, 2100.0]), np.array([25.0, 26.0]), np.array([48.0, 50.0])
+    )
+    for i, (gold, silver, rate) in enumerate(
+        [(2000.0, 25.0, 48.0), (2100.0, 26.0, 50.0)]
+    ):
+        assert [column[i] for column in batch] == pytest.approx(
+            converter.convert(gold, silver, rate)
+        )
+
+
+def test_convert_batch_rejects_mismatched_lengths(config):
+    converter = PriceConverter(config)
+    with pytest.raises(ValueError):
+        converter.convert_batch(
+            np.array([2000.0, 2100.0, 2200.0]),
+            np.array([25.0, 26.0]),
+            np.array([48.0, 48.0, 48.0]),
+        )
+
+
+def test_run_batch_rejects_mismatched_lengths_without_writing(config, tracker):
+    with pytest.raises(ValueError):
+        tracker.run_batch(
+            ["t0", "t1"], [2000.0, 2100.0, 2200.0], [25.0] * 3, [48.0] * 3
+        )
+    tracker.logger.close()
+    with open(config.CSV_FILE, encoding="utf-8") as file:
+        assert file.read() == ""
+
+
+def snapshot(timestamp="2024-01-01 00:00:00"):
+    return PriceSnapshot(
+        timestamp, 2000.0, 25.0, 96000.0, 1200.0, 64.3, 0.8, 3086.5, 38.6
+    )
+
+
+def read_csv_lines(config):
+    with open(config.CSV_FILE, encoding="ascii", newline="") as file:
+        return file.read().split("\r\n")[:-1]
+
+
+def test_header_written_once_across_loggers(config):
+    for _ in range(2):
+        logger = DataLogger(config)
+        logger.log_many([snapshot(), snapshot()])
+        logger.close()
+    lines = read_csv_lines(config)
+    assert lines[0] == ";".join(DataLogger.CSV_HEADER)
+    assert len(lines) == 5
+    assert lines.count(lines[0]) == 1
+
+
+def test_header_written_to_existing_empty_file(config):
+    open(config.CSV_FILE, "w").close()
+    logger = DataLogger(config)
+    logger.log_many([snapshot()])
+    logger.close()
+    assert read_csv_lines(config)[0] == ";".join(DataLogger.CSV_HEADER)
+
+
+def test_rows_written_per_batch_then_on_flush(config):
+    logger = DataLogger(config)
+    logger.log_many([snapshot()] * (DataLogger.LOG_BATCH_SIZE - 1))
+    logger._csv_fh.flush()
+    assert os.path.getsize(config.CSV_FILE) == 0
+    logger.log_many([snapshot()] * 3)
+    logger._csv_fh.flush()
+    assert len(read_csv_lines(config)) == 1 + DataLogger.LOG_BATCH_SIZE + 2
+    logger.flush_now()
+    assert len(read_csv_lines(config)) == 1 + DataLogger.LOG_BATCH_SIZE + 2
+    logger.log_many([snapshot()])
+    logger.close()
+    assert len(read_csv_lines(config)) == 1 + DataLogger.LOG_BATCH_SIZE + 3
+
+
+def test_batch_with_unencodable_row_queues_nothing(config, tracker):
+    timestamps = ["2024-01-01 00:00:00", "2024\u201001-02 00:00:00"]
+    with pytest.raises(UnicodeEncodeError):
+        tracker.run_batch(timestamps, [2000.0] * 2, [25.0] * 2, [48.0] * 2)
+    tracker.logger.log_many([snapshot("2024-01-03 00:00:00")])
+    tracker.logger.close()
+    rows = read_csv_lines(config)[1:]
+    assert [row.split(";")[0] for row in rows] == ["2024-01-03 00:00:00"]
+
+
+@pytest.mark.parametrize(
+    "argv", [["--interval", "60"], ["--quiet", "--test", "--interval", "60"]]
+)
+def test_main_rejects_invalid_interval_combinations(monkeypatch, argv):
+    monkeypatch.setattr("sys.argv", ["metal_prices_tracker.py", *argv])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2